@@ -14,13 +14,19 @@ Key Features:
 - Debug visualization for development and testing
 
 The application runs multiple components concurrently:
-- Camera capture and OCR processing (main thread)
+- Camera capture and display (main thread)
+- OCR text detection (background worker thread)
 - Barcode input handling (background thread)
 - Web API server (background thread)
 - Text-to-speech synthesis (background thread)
 """
 
+import logging
+import logging.handlers
+import signal
+import threading
 import time
+from queue import Queue
 
 import cv2
 
@@ -29,12 +35,38 @@ from src.camera.camera_manager import CameraManager
 from src.config import Config
 from src.db.models import DatabaseManager
 from src.image_processing.image_processor import ImageProcessor
+from src.ocr.ocr_worker import OCRWorker
 from src.ocr.text_detector import TextDetector
 from src.speech.tts_manager import TTSManager
 from src.visualization.display import DisplayManager
 from src.visualization.text_overlay import TextOverlay
 from src.web.api import start_server
 
+# Per-frame diagnostics go through a QueueHandler so the hot loop only
+# pays for an enqueue; formatting and the stdout write (which contends
+# with the barcode reader's stdin) happen on the listener thread
+log = logging.getLogger("shop_assist")
+
+
+def setup_logging():
+    """
+    Configure queue-based logging for the hot-loop diagnostics.
+
+    The main loop logs through a QueueHandler, and a QueueListener thread
+    does the actual formatting and stream writing, so per-frame logging
+    never blocks on stdout.
+
+    Returns:
+        logging.handlers.QueueListener: The started listener (caller stops
+        it on shutdown)
+    """
+    log_queue = Queue()
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.setLevel(logging.DEBUG)
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    return listener
+
 
 def main():
     """
@@ -47,13 +79,17 @@ def main():
     # Uncomment to enable debug visualization windows
     # Config.enable_debug()
 
-    # Start the web API server for configuration and barcode management
-    start_server()
+    log_listener = setup_logging()
 
     # Initialize shared components that will be used across multiple modules
     db_manager = DatabaseManager()
+    db_manager.init_db()
     tts_manager = TTSManager()
 
+    # Start the web API server for configuration and barcode management,
+    # sharing the database manager (one cache, one connection pool)
+    start_server(db_manager=db_manager)
+
     # Initialize barcode input handler with shared dependencies
     # This runs in a background thread to avoid blocking camera operations
     barcode_handler = BarcodeInputHandler(
@@ -66,70 +102,116 @@ def main():
     display = DisplayManager()
     text_detector = TextDetector(tts_manager=tts_manager)
 
-    # Initialize performance monitoring variables
+    # Initialize performance monitoring variables. FPS is exponentially
+    # smoothed so the debug overlay stays readable instead of jumping
+    # with every frame-time spike
     fps = 0
-    frame_time = time.time()
+    frame_time = time.perf_counter()
+
+    # Background OCR worker decouples Tesseract latency from the
+    # capture/display rate: the loop submits the freshest frame and
+    # renders the most recent result available
+    ocr_worker = OCRWorker(text_detector)
+    ocr_worker.start()
+
+    # Last OCR result received from the worker, drawn until a newer one lands
+    boxes, text = {}, ""
+
+    # In production (non-debug) mode there are no windows to receive key
+    # events, so shutdown is driven by Ctrl+C instead of the 'q' key
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+
+    # Tracks whether debug windows are currently open so cleanup runs
+    # once on the debug->production transition, not every frame
+    windows_open = False
+
+    # Hoist Config.DEBUG into a local to avoid the class attribute lookup
+    # on every frame; a settings-change callback flags when to re-read it
+    debug = Config.DEBUG
+    settings_changed = threading.Event()
+    Config.register_callback(settings_changed.set)
 
     try:
-        # Initialize camera hardware
-        camera.initialize()
-
-        # Main processing loop - continues until 'q' key is pressed
-        while True:
-            # Capture frame from camera
-            ret, frame = camera.get_frame()
-            if not ret:
-                print("Failed to capture frame, exiting...")
-                break
-
-            # Calculate and update FPS for performance monitoring
-            current_time = time.time()
-            fps = 1 / (current_time - frame_time)
-            frame_time = current_time
-
-            # Apply image preprocessing to enhance OCR accuracy
-            processed_frame, normalized = ImageProcessor.preprocess(frame)
-
-            # Perform OCR text detection and trigger TTS if new text is found
-            boxes, text = text_detector.process_frame(processed_frame)
-
-            # Handle debug visualization if enabled
-            if Config.DEBUG:
-                # Draw bounding boxes and text on the original frame
-                annotated_frame = TextOverlay.draw_boxes(frame, boxes, draw_text=True)
-                annotated_frame = TextOverlay.draw_fps(annotated_frame, fps)
-
-                # Show multiple processing stages for debugging
-                display.show("Debug", annotated_frame)
-                display.show("Normalized", normalized)
-                display.show("Processed", processed_frame)
-
-                # Print detected text and confidence metrics to console
-                if text:
-                    print(f"Detected text: {text}")
-                    # Calculate and display confidence only if detection data exists
-                    if boxes.get("conf"):
-                        avg_conf = text_detector.get_average_confidence(boxes)
-                        print(f"Average confidence: {avg_conf:.2f}")
-                    else:
-                        print(
-                            "Average confidence: N/A (no text detected with sufficient confidence)"
-                        )
-            else:
-                # Clean up debug windows if debug mode is disabled
-                display.cleanup()
-
-            # Check for 'q' key press to exit application
-            if cv2.waitKey(1) & 0xFF == ord("q"):
-                print("Exit key pressed, shutting down...")
-                break
+        # Initialize camera hardware; the context manager guarantees
+        # release even if the loop raises
+        with camera:
+            # Main processing loop - runs until Ctrl+C (or 'q' in debug mode)
+            while not stop_event.is_set():
+                # Capture frame from camera
+                ret, frame = camera.get_frame()
+                if not ret:
+                    print("Failed to capture frame, exiting...")
+                    break
+
+                # Update the smoothed FPS estimate for performance monitoring
+                current_time = time.perf_counter()
+                instant_fps = 1 / (current_time - frame_time)
+                frame_time = current_time
+                fps = fps * 0.9 + instant_fps * 0.1 if fps else instant_fps
+
+                # Apply image preprocessing to enhance OCR accuracy
+                processed_frame, normalized = ImageProcessor.preprocess(frame)
+
+                # Hand the freshest frame to the OCR worker (with the scale
+                # needed to map boxes back to full resolution) and pick up
+                # its latest result without ever blocking the display loop
+                ocr_worker.submit(processed_frame, ImageProcessor.ocr_scale)
+                result = ocr_worker.get_result()
+                if result is not None:
+                    boxes, text = result
+
+                # Re-snapshot hoisted settings only when they actually changed
+                if settings_changed.is_set():
+                    settings_changed.clear()
+                    debug = Config.DEBUG
+
+                # Handle debug visualization if enabled
+                if debug:
+                    # Draw bounding boxes and text on the original frame
+                    annotated_frame = TextOverlay.draw_boxes(frame, boxes, draw_text=True)
+                    annotated_frame = TextOverlay.draw_fps(annotated_frame, fps)
+
+                    # Show multiple processing stages for debugging
+                    display.show("Debug", annotated_frame)
+                    display.show("Normalized", normalized)
+                    display.show("Processed", processed_frame)
+                    windows_open = True
+
+                    # waitKey both pumps the HighGUI event loop for the debug
+                    # windows and checks for the 'q' exit key; in production
+                    # mode there are no windows, so skipping it saves the
+                    # ~1 ms GUI roundtrip per frame
+                    if cv2.waitKey(1) & 0xFF == ord("q"):
+                        print("Exit key pressed, shutting down...")
+                        break
+
+                    # Log detected text and confidence metrics; %-style args
+                    # defer string building to the listener thread
+                    if text:
+                        log.debug("Detected text: %s", text)
+                        # Calculate and display confidence only if detection data exists
+                        if boxes.get("conf"):
+                            log.debug(
+                                "Average confidence: %.2f",
+                                text_detector.get_average_confidence(boxes),
+                            )
+                        else:
+                            log.debug(
+                                "Average confidence: N/A (no text detected with sufficient confidence)"
+                            )
+                elif windows_open:
+                    # Close debug windows once when debug mode is turned off
+                    display.cleanup()
+                    windows_open = False
 
     finally:
         # Ensure proper cleanup of all resources
         print("Cleaning up resources...")
+        ocr_worker.stop()  # Signal OCR worker shutdown and join it
         barcode_handler.stop()  # Stop barcode input thread
-        camera.release()  # Release camera hardware
         display.cleanup()  # Close debug windows
+        log_listener.stop()  # Flush and stop the logging thread
 
 
 if __name__ == "__main__":
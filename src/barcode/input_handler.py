@@ -20,22 +20,60 @@ Usage:
     handler.stop()   # Clean shutdown when done
 """
 
+import functools
+import os
+import select
 import sys
 import threading
 import time
-from queue import Queue
+from queue import Empty, Queue
 
 from ..config import Config
 from ..db.models import DatabaseManager
 from ..speech.tts_manager import TTSManager
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_lookup(db_manager, barcode):
+    """
+    Look up a barcode with an LRU cache in front of the database.
+
+    Shopping trips re-scan the same items frequently, so repeat lookups
+    are served from memory instead of paying a SQL round-trip each time.
+    The working set of a single trip fits comfortably in 1024 entries.
+
+    Args:
+        db_manager (DatabaseManager): Database manager to query on a miss
+        barcode (str): The barcode identifier to look up
+
+    Returns:
+        Barcode: The barcode object if found, None otherwise
+    """
+    return db_manager.get_barcode(barcode)
+
+
+def clear_barcode_cache():
+    """
+    Invalidate the cached barcode lookups.
+
+    Must be called whenever the barcode table is mutated (e.g. by the
+    web API) so stale product data is not announced.
+    """
+    _cached_lookup.cache_clear()
+
+
 class BarcodeInputHandler:
     """
     Handles barcode scanner input from the terminal.
     Runs in a separate thread to avoid blocking the main OCR functionality.
+
+    Attributes:
+        MAX_BATCH (int): Maximum number of queued scans combined into a
+            single database lookup and TTS announcement
     """
 
+    MAX_BATCH = 4
+
     def __init__(self, db_manager=None, tts_manager=None):
         """
         Initialize the barcode input handler with optional dependencies.
@@ -52,6 +90,9 @@ class BarcodeInputHandler:
         self.running = False
         self.input_queue = Queue()
         self.current_barcode = ""
+        # Recently announced messages as (monotonic_time, text) pairs,
+        # used to suppress duplicate utterances from rapid re-scans
+        self._recent_announcements = []
 
     def start(self):
         """
@@ -73,10 +114,12 @@ class BarcodeInputHandler:
         """
         Stop the barcode input handler and wait for thread termination.
 
-        Sets the running flag to False and waits up to 1 second for the
-        input thread to terminate gracefully. Used for clean shutdown.
+        Clears the running flag and pushes a sentinel into the queue so
+        the consumer thread wakes immediately instead of waiting out its
+        queue timeout. Used for clean shutdown.
         """
         self.running = False
+        self.input_queue.put(None)  # Sentinel wakes the blocked consumer
         if self.input_thread and self.input_thread.is_alive():
             self.input_thread.join(timeout=1.0)
 
@@ -84,21 +127,39 @@ class BarcodeInputHandler:
         """
         Main processing loop that runs in the background thread.
 
-        Starts a separate input reader thread and continuously processes
-        barcodes from the queue. Uses a short sleep interval to reduce
-        CPU usage while maintaining responsiveness.
+        Starts a separate input reader thread and blocks on the queue
+        until a barcode arrives, so scans are dispatched immediately and
+        the thread consumes no CPU while idle. A None sentinel from
+        stop() terminates the loop.
         """
         # Start a separate thread to read from stdin
         input_reader = threading.Thread(target=self._read_input, daemon=True)
         input_reader.start()
 
         while self.running:
-            # Process any barcodes in the queue
             try:
-                if not self.input_queue.empty():
-                    barcode = self.input_queue.get(block=False)
-                    self._process_barcode(barcode)
-                time.sleep(0.1)  # Sleep to reduce CPU usage
+                barcode = self.input_queue.get(timeout=0.5)
+            except Empty:
+                continue
+
+            if barcode is None:  # Shutdown sentinel from stop()
+                break
+
+            # Drain any burst of scans that arrived together so they can
+            # be looked up and announced as one batch instead of queueing
+            # N utterances behind each other
+            batch = [barcode]
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    extra = self.input_queue.get_nowait()
+                except Empty:
+                    break
+                if extra is None:  # Sentinel - process what we have, then exit
+                    break
+                batch.append(extra)
+
+            try:
+                self._process_barcodes(batch)
             except Exception as e:
                 print(f"Error in barcode input processing: {e}")
 
@@ -107,8 +168,42 @@ class BarcodeInputHandler:
         Read barcode input from stdin and queue it for processing.
 
         Runs in its own thread to avoid blocking other operations.
-        Handles EOF conditions (Ctrl+D) and other input errors gracefully.
-        Only non-empty barcodes are queued for processing.
+        On POSIX systems stdin is polled with select so the thread
+        re-checks the running flag several times per second and exits
+        promptly on stop() instead of blocking forever in input().
+        Windows stdin is not selectable, so it falls back to blocking
+        reads there. Only non-empty barcodes are queued for processing.
+        """
+        if os.name != "nt":
+            self._read_input_select()
+        else:
+            self._read_input_blocking()
+
+    def _read_input_select(self):
+        """
+        Poll stdin with select.select for deterministic shutdown (POSIX).
+        """
+        while self.running:
+            try:
+                readable, _, _ = select.select([sys.stdin], [], [], 0.2)
+                if not readable:
+                    continue
+                line = sys.stdin.readline()
+                if not line:
+                    # EOF (Ctrl+D or closed stdin): select reports an
+                    # exhausted stdin as permanently readable, so keep
+                    # looping would busy-spin - no input can ever arrive
+                    break
+                barcode = line.strip()
+                if barcode:
+                    self.input_queue.put(barcode)
+            except Exception as e:
+                print(f"Error reading barcode input: {e}")
+                time.sleep(0.5)
+
+    def _read_input_blocking(self):
+        """
+        Blocking input() fallback for platforms without selectable stdin.
         """
         while self.running:
             try:
@@ -124,6 +219,35 @@ class BarcodeInputHandler:
                 print(f"Error reading barcode input: {e}")
                 time.sleep(0.5)
 
+    def _process_barcodes(self, barcodes):
+        """
+        Process a batch of scanned barcodes with one lookup and utterance.
+
+        Real scanners can fire several codes in under a second; looking
+        them up with a single IN-list query and concatenating the
+        announcements into one TTS call keeps audio feedback prompt
+        instead of serializing N utterances behind each other.
+
+        Args:
+            barcodes (list[str]): The scanned barcode identifiers to process
+        """
+        if len(barcodes) == 1:
+            self._process_barcode(barcodes[0])
+            return
+
+        print(f"\nBarcodes scanned: {', '.join(barcodes)}")
+
+        # Single batched lookup for the whole burst
+        barcode_infos = self.db_manager.get_barcodes(barcodes)
+        messages = [
+            self._format_message(code, barcode_infos.get(code)) for code in barcodes
+        ]
+
+        # Announce the whole batch as one utterance
+        combined = ". ".join(messages)
+        if self.tts_manager and self._should_announce(combined):
+            self.tts_manager.say_async(combined)
+
     def _process_barcode(self, barcode):
         """
         Process a scanned barcode by looking it up and providing feedback.
@@ -138,28 +262,59 @@ class BarcodeInputHandler:
         """
         print(f"\nBarcode scanned: {barcode}")
 
-        # Look up the barcode in the database
-        barcode_info = self.db_manager.get_barcode(barcode)
+        # Look up the barcode, served from the LRU cache on repeat scans
+        barcode_info = _cached_lookup(self.db_manager, barcode)
+        message = self._format_message(barcode, barcode_info)
+
+        # Provide audio feedback if TTS is available and this isn't a
+        # duplicate of something just announced
+        if self.tts_manager and self._should_announce(message):
+            self.tts_manager.say_async(message)
+
+    def _should_announce(self, text, window=2.0):
+        """
+        Decide whether a message should be spoken or is a recent duplicate.
+
+        Rapid re-scans of the same item would otherwise queue a cascade
+        of identical utterances behind the speech engine. Messages spoken
+        within the last `window` seconds are suppressed.
+
+        Args:
+            text (str): The candidate announcement
+            window (float): Deduplication window in seconds
+
+        Returns:
+            bool: True if the message should be spoken
+        """
+        now = time.monotonic()
+        self._recent_announcements = [
+            (t, s) for t, s in self._recent_announcements if now - t < window
+        ]
+        if any(s == text for _, s in self._recent_announcements):
+            return False
+        self._recent_announcements.append((now, text))
+        return True
+
+    def _format_message(self, barcode, barcode_info):
+        """
+        Build the announcement for a barcode and print its console line.
+
+        Args:
+            barcode (str): The scanned barcode identifier
+            barcode_info (Barcode): Database entry, or None if unknown
 
+        Returns:
+            str: The rendered TTS message for this barcode
+        """
         if barcode_info:
-            # Format the TTS message with product information
-            message = Config.TTS_BARCODE_FOUND_TEMPLATE.format(
+            print(
+                f"Product: {barcode_info.product_name}, Brand: {barcode_info.brand}, Allergies: {barcode_info.allergies or 'none'}"
+            )
+            return Config._barcode_found_fmt(
                 product_name=barcode_info.product_name,
                 brand=barcode_info.brand,
                 allergies=barcode_info.allergies or "none",
             )
-            print(
-                f"Product: {barcode_info.product_name}, Brand: {barcode_info.brand}, Allergies: {barcode_info.allergies or 'none'}"
-            )
-
-            # Provide audio feedback if TTS is available
-            if self.tts_manager:
-                self.tts_manager.say_async(message)
-        else:
-            # Handle unknown barcode case
-            message = Config.TTS_BARCODE_NOT_FOUND_TEMPLATE.format(barcode=barcode)
-            print(f"Unknown barcode: {barcode}")
 
-            # Provide audio feedback for unknown barcode
-            if self.tts_manager:
-                self.tts_manager.say_async(message)
+        print(f"Unknown barcode: {barcode}")
+        return Config._barcode_not_found_fmt(barcode=barcode)
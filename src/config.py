@@ -5,6 +5,38 @@ This module provides centralized configuration settings for all components
 including TTS, image processing, and debugging options.
 """
 
+import string
+
+
+def _compile_template(template):
+    """
+    Pre-parse a str.format-style template into a fast render function.
+
+    str.format re-parses the format mini-language on every call; this
+    walks the template once with string.Formatter and returns a closure
+    that just joins literals and substituted fields. Used for the TTS
+    templates that sit on the per-scan hot path.
+
+    Args:
+        template (str): Template string with {field} placeholders
+
+    Returns:
+        callable: Function accepting the fields as keyword arguments and
+                 returning the rendered string
+    """
+    segments = list(string.Formatter().parse(template))
+
+    def render(**fields):
+        parts = []
+        for literal, field_name, format_spec, _ in segments:
+            parts.append(literal)
+            if field_name is not None:
+                value = fields[field_name]
+                parts.append(format(value, format_spec) if format_spec else str(value))
+        return "".join(parts)
+
+    return render
+
 
 class Config:
     """
@@ -21,6 +53,7 @@ class Config:
         TTS_BARCODE_FOUND_TEMPLATE (str): Template for product announcements
         TTS_BARCODE_NOT_FOUND_TEMPLATE (str): Message for unknown products
         THRESHOLDING (int): Image processing threshold value
+        OCR_MAX_WIDTH (int): Maximum frame width handed to OCR
     """
 
     # Debug settings
@@ -36,16 +69,73 @@ class Config:
 
     # Image processing settings
     THRESHOLDING = 70
+    # Frames wider than this are downscaled before OCR; Tesseract runtime
+    # scales with pixel count while label text stays legible well below
+    # full camera resolution
+    OCR_MAX_WIDTH = 960
+
+    # Explicit allow-list of the public settings above. Avoids the
+    # dir()-based introspection that walked and type-checked every class
+    # attribute on each get_all_settings/update_settings call (which the
+    # web API performs per request). New settings must be added here.
+    _SETTING_NAMES = (
+        "DEBUG",
+        "TTS_SPEED",
+        "TTS_OCR_TEMPLATE",
+        "TTS_BARCODE_FOUND_TEMPLATE",
+        "TTS_BARCODE_NOT_FOUND_TEMPLATE",
+        "THRESHOLDING",
+        "OCR_MAX_WIDTH",
+    )
+
+    # Callbacks notified whenever settings change, so hot loops that
+    # snapshot settings into locals know when to re-read them
+    _change_callbacks = []
+
+    @classmethod
+    def _compile_templates(cls):
+        """
+        Rebuild the pre-parsed renderers for all TTS templates.
+
+        Called once at import and again whenever settings change, so the
+        per-scan/per-frame paths never re-parse template strings.
+        """
+        cls._barcode_found_fmt = _compile_template(cls.TTS_BARCODE_FOUND_TEMPLATE)
+        cls._barcode_not_found_fmt = _compile_template(
+            cls.TTS_BARCODE_NOT_FOUND_TEMPLATE
+        )
+        cls._ocr_fmt = _compile_template(cls.TTS_OCR_TEMPLATE)
+
+    @classmethod
+    def register_callback(cls, callback):
+        """
+        Register a callback invoked whenever settings are updated.
+
+        Components that hoist settings into local variables for per-frame
+        use can register here to learn when a re-snapshot is needed.
+
+        Args:
+            callback (callable): Zero-argument callable invoked on change
+        """
+        cls._change_callbacks.append(callback)
+
+    @classmethod
+    def _notify_change(cls):
+        """Invoke all registered settings-change callbacks."""
+        for callback in cls._change_callbacks:
+            callback()
 
     @classmethod
     def enable_debug(cls):
         """Enable debug mode to show visual processing windows."""
         cls.DEBUG = True
+        cls._notify_change()
 
     @classmethod
     def disable_debug(cls):
         """Disable debug mode to hide visual processing windows."""
         cls.DEBUG = False
+        cls._notify_change()
 
     @classmethod
     def update_settings(cls, settings_dict):
@@ -61,10 +151,13 @@ class Config:
         valid_settings = {
             key: value
             for key, value in settings_dict.items()
-            if hasattr(cls, key) and not key.startswith("_")
+            if key in cls._SETTING_NAMES
         }
         for key, value in valid_settings.items():
             setattr(cls, key, type(getattr(cls, key))(value))
+        if valid_settings:
+            cls._compile_templates()
+            cls._notify_change()
         return valid_settings
 
     @classmethod
@@ -75,10 +168,8 @@ class Config:
         Returns:
             dict: All public configuration settings and their current values
         """
-        return {
-            key: getattr(cls, key)
-            for key in dir(cls)
-            if not key.startswith("_")
-            and not callable(getattr(cls, key))
-            and isinstance(getattr(cls, key), (bool, int, float, str, list, dict))
-        }
+        return {key: getattr(cls, key) for key in cls._SETTING_NAMES}
+
+
+# Build the initial template renderers at import time
+Config._compile_templates()
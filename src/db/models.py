@@ -6,13 +6,23 @@ including product names, brands, and allergen information. It uses SQLAlchemy
 ORM for database operations and includes comprehensive error handling.
 """
 
-from sqlalchemy import Column, String, create_engine
+import threading
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+
+from sqlalchemy import Column, String, create_engine, event, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 Base = declarative_base()
 
+# Detached, immutable snapshot of a barcode row. Cached lookups return
+# these instead of ORM objects so no session-attachment rules apply.
+BarcodeInfo = namedtuple("BarcodeInfo", ["barcode", "product_name", "brand", "allergies"])
+
 
 class BarcodeExistsError(Exception):
     """Raised when attempting to add a barcode that already exists in the database."""
@@ -59,6 +69,9 @@ class DatabaseManager:
         Session: SQLAlchemy session maker class
     """
 
+    # Upper bound on cached barcode lookups before LRU eviction kicks in
+    CACHE_MAX_ENTRIES = 4096
+
     def __init__(self, db_url="sqlite:///database.db"):
         """
         Initialize the database manager with a connection URL.
@@ -66,8 +79,56 @@ class DatabaseManager:
         Args:
             db_url (str): Database connection URL, defaults to SQLite file
         """
-        self.engine = create_engine(db_url)
-        self.Session = sessionmaker(bind=self.engine)
+        # Read-through LRU cache of barcode lookups (None entries record
+        # known misses). The catalog is small and mostly static, so
+        # repeat scans become a dict hit instead of a SQL round-trip.
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Full-catalog cache: bumping _catalog_version on any write
+        # invalidates it, so list endpoints reread the table only after
+        # actual changes. Stored column-wise (structure of arrays) so
+        # filtering/searching can scan plain lists instead of objects.
+        self._catalog_version = 0
+        self._catalog_cache = None
+        # Large insertmanyvalues pages keep bulk imports to a handful of
+        # driver round-trips. check_same_thread is disabled since both
+        # the scanner thread and the web API workers use this manager;
+        # the default QueuePool then hands each thread its own pooled
+        # connection (sharing one sqlite3 connection across threads lets
+        # concurrent transactions interleave and corrupt each other),
+        # and the WAL pragmas below let those connections read and write
+        # concurrently. In-memory databases are the exception: every new
+        # connection would see its own empty database, so they keep the
+        # single shared StaticPool connection.
+        engine_kwargs = {"insertmanyvalues_page_size": 10_000}
+        if db_url.startswith("sqlite"):
+            engine_kwargs["connect_args"] = {"check_same_thread": False}
+            if ":memory:" in db_url or db_url in ("sqlite://", "sqlite:///"):
+                engine_kwargs["poolclass"] = StaticPool
+        self.engine = create_engine(db_url, **engine_kwargs)
+
+        if db_url.startswith("sqlite"):
+            # SQLite defaults to DELETE journaling with synchronous=FULL,
+            # which pays multiple fsyncs per single-row commit. WAL with
+            # NORMAL sync makes commits a sequential log append and lets
+            # readers proceed while a write is in flight. Fires once per
+            # pooled connection, so every connection carries the pragmas
+            # for its lifetime.
+            @event.listens_for(self.engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.execute("PRAGMA mmap_size=268435456")
+                cursor.close()
+
+        # One long-lived session per thread; expire_on_commit=False keeps
+        # returned objects readable after the transaction ends
+        self.Session = scoped_session(
+            sessionmaker(bind=self.engine, expire_on_commit=False)
+        )
 
     def init_db(self):
         """
@@ -79,13 +140,31 @@ class DatabaseManager:
 
     def get_session(self):
         """
-        Create and return a new database session.
+        Return the thread-local database session.
 
         Returns:
             Session: SQLAlchemy session object
         """
         return self.Session()
 
+    @contextmanager
+    def _session(self):
+        """
+        Yield the thread-local session with commit/rollback handling.
+
+        Commits on success and rolls back on error in one place, so the
+        CRUD methods don't each re-implement session bookkeeping. The
+        session itself stays alive for reuse by the next call on this
+        thread.
+        """
+        session = self.Session()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
     def add_barcode(
         self, barcode: str, product_name: str, brand: str, allergies: str = None
     ) -> dict:
@@ -105,38 +184,87 @@ class DatabaseManager:
             BarcodeExistsError: If the barcode already exists in the database
             Exception: For other database-related errors
         """
-        session = self.get_session()
+        # If allergies is None or empty, set it to "none"
+        if not allergies:
+            allergies = "none"
+
         try:
-            # If allergies is None or empty, set it to "none"
-            if not allergies:
-                allergies = "none"
+            with self._session() as session:
+                barcode_entry = Barcode(
+                    barcode=barcode,
+                    product_name=product_name,
+                    brand=brand,
+                    allergies=allergies,
+                )
+                session.add(barcode_entry)
+        except IntegrityError:
+            raise BarcodeExistsError(f"Barcode '{barcode}' already exists.")
 
-            barcode_entry = Barcode(
+        # Refresh the cache entry (which may have recorded a miss)
+        self._bump_catalog_version()
+        self._cache_store(
+            barcode,
+            BarcodeInfo(
                 barcode=barcode,
                 product_name=product_name,
                 brand=brand,
                 allergies=allergies,
+            ),
+        )
+
+        return {
+            "barcode": barcode_entry.barcode,
+            "product_name": barcode_entry.product_name,
+            "brand": barcode_entry.brand,
+            "allergies": barcode_entry.allergies,
+        }
+
+    def add_barcodes_bulk(self, rows: list[dict]) -> list[str]:
+        """
+        Insert many barcode entries in a single transaction.
+
+        Intended for catalog imports where per-row add_barcode calls
+        would pay a session, INSERT, and commit per entry. All rows go
+        through one INSERT ... ON CONFLICT DO NOTHING, so entries whose
+        barcode already exists are skipped rather than raising.
+
+        Args:
+            rows (list[dict]): Dictionaries with 'barcode', 'product_name',
+                              'brand', and optional 'allergies' keys
+
+        Returns:
+            list[str]: Barcodes that were actually inserted (requested
+                      codes that already existed are omitted)
+        """
+        if not rows:
+            return []
+
+        # Normalize missing/empty allergies the same way add_barcode does
+        rows = [{**row, "allergies": row.get("allergies") or "none"} for row in rows]
+        codes = [row["barcode"] for row in rows]
+
+        with self.engine.begin() as conn:
+            existing = set(
+                conn.execute(
+                    select(Barcode.barcode).where(Barcode.barcode.in_(codes))
+                ).scalars()
             )
-            session.add(barcode_entry)
-            session.commit()
-            # Make a detached copy of attributes before closing the session
-            result = {
-                "barcode": barcode_entry.barcode,
-                "product_name": barcode_entry.product_name,
-                "brand": barcode_entry.brand,
-                "allergies": barcode_entry.allergies,
-            }
-            return result
-        except IntegrityError:
-            session.rollback()
-            raise BarcodeExistsError(f"Barcode '{barcode}' already exists.")
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+            conn.execute(
+                sqlite_insert(Barcode.__table__).on_conflict_do_nothing(
+                    index_elements=["barcode"]
+                ),
+                rows,
+            )
+
+        # Drop any cached misses for codes that now exist
+        self._bump_catalog_version()
+        with self._cache_lock:
+            for code in codes:
+                self._cache.pop(code, None)
+
+        return [code for code in codes if code not in existing]
 
-    def get_barcode(self, barcode: str) -> Barcode:
+    def get_barcode(self, barcode: str) -> BarcodeInfo | None:
         """
         Retrieve a barcode entry from the database.
 
@@ -144,26 +272,181 @@ class DatabaseManager:
             barcode (str): The barcode identifier to search for
 
         Returns:
-            Barcode: The barcode object if found, None otherwise
+            BarcodeInfo: Detached snapshot of the entry if found, None
+                        otherwise
         """
-        session = self.get_session()
-        try:
-            return session.query(Barcode).filter(Barcode.barcode == barcode).first()
-        finally:
-            session.close()
+        with self._cache_lock:
+            if barcode in self._cache:
+                self._cache.move_to_end(barcode)
+                return self._cache[barcode]
+
+        with self._session() as session:
+            # Primary-key lookup hits the identity map and skips query
+            # compilation entirely
+            entry = session.get(Barcode, barcode)
+
+        info = self._to_info(entry)
+        self._cache_store(barcode, info)
+        return info
+
+    def _to_info(self, entry):
+        """
+        Convert an ORM Barcode row to a detached BarcodeInfo snapshot.
+
+        Args:
+            entry (Barcode): ORM object, or None
+
+        Returns:
+            BarcodeInfo: Snapshot of the row, or None if entry was None
+        """
+        if entry is None:
+            return None
+        return BarcodeInfo(
+            barcode=entry.barcode,
+            product_name=entry.product_name,
+            brand=entry.brand,
+            allergies=entry.allergies,
+        )
+
+    def _cache_store(self, barcode, info):
+        """
+        Insert a lookup result into the LRU cache, evicting if full.
+
+        Args:
+            barcode (str): Cache key
+            info (BarcodeInfo): Lookup result (None records a known miss)
+        """
+        with self._cache_lock:
+            self._cache[barcode] = info
+            self._cache.move_to_end(barcode)
+            while len(self._cache) > self.CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+    def get_barcodes(self, barcodes: list[str]) -> dict[str, BarcodeInfo | None]:
+        """
+        Retrieve multiple barcode entries with at most a single query.
+
+        Codes already in the LRU cache (including recorded misses) are
+        served from memory; only the remainder goes into one
+        SELECT ... WHERE barcode IN (...), instead of a round-trip per
+        code. Fetched entries are cached for subsequent lookups.
+
+        Args:
+            barcodes (list[str]): The barcode identifiers to search for
 
-    def get_all_barcodes(self) -> list[Barcode]:
+        Returns:
+            dict: Mapping of each requested barcode to its BarcodeInfo
+                 snapshot, or None for codes not present in the database
+        """
+        result = {}
+        missing = []
+        with self._cache_lock:
+            for code in barcodes:
+                if code in self._cache:
+                    self._cache.move_to_end(code)
+                    result[code] = self._cache[code]
+                else:
+                    missing.append(code)
+
+        if missing:
+            with self._session() as session:
+                found = session.execute(
+                    select(Barcode).where(Barcode.barcode.in_(missing))
+                ).scalars()
+                fetched = {entry.barcode: self._to_info(entry) for entry in found}
+            for code in missing:
+                info = fetched.get(code)
+                result[code] = info
+                self._cache_store(code, info)
+
+        # Rebuild in request order for predictable iteration downstream
+        return {code: result[code] for code in barcodes}
+
+    def get_all_barcodes(self) -> list[BarcodeInfo]:
         """
         Retrieve all barcode entries from the database.
 
+        Served from the version-keyed catalog cache; the table is only
+        re-read after a write actually changed it.
+
         Returns:
-            list[Barcode]: List of all barcode objects in the database
+            list[BarcodeInfo]: Snapshots of all entries in the database
         """
-        session = self.get_session()
-        try:
-            return session.query(Barcode).all()
-        finally:
-            session.close()
+        return self._load_catalog()["rows"]
+
+    def get_all_barcodes_columns(self) -> dict:
+        """
+        Retrieve the full catalog as parallel column lists.
+
+        Column-wise access suits consumers that filter or serialize whole
+        columns, avoiding per-object attribute lookups.
+
+        Returns:
+            dict: Mapping of 'barcode', 'product_name', 'brand', and
+                 'allergies' to parallel lists of values
+        """
+        return self._load_catalog()["columns"]
+
+    def _load_catalog(self):
+        """
+        Return the cached catalog, refreshing it if a write occurred.
+
+        Selects plain column tuples instead of hydrating ORM objects,
+        and stores both row snapshots and column lists under the version
+        captured before the query.
+
+        Returns:
+            dict: Cache entry with 'rows' and 'columns' keys
+        """
+        with self._cache_lock:
+            cached = self._catalog_cache
+            version = self._catalog_version
+        if cached is not None and cached["version"] == version:
+            return cached
+
+        with self._session() as session:
+            rows = session.execute(
+                select(
+                    Barcode.barcode,
+                    Barcode.product_name,
+                    Barcode.brand,
+                    Barcode.allergies,
+                )
+            ).all()
+
+        columns = dict(
+            zip(
+                ("barcode", "product_name", "brand", "allergies"),
+                (list(column) for column in zip(*rows)) if rows else ([], [], [], []),
+            )
+        )
+        cached = {
+            "version": version,
+            "rows": [BarcodeInfo(*row) for row in rows],
+            "columns": columns,
+        }
+        with self._cache_lock:
+            self._catalog_cache = cached
+        return cached
+
+    @property
+    def catalog_version(self):
+        """
+        Monotonic counter incremented by every catalog write.
+
+        Cheap change detection for consumers of the full catalog (e.g.
+        HTTP ETags): equal versions guarantee identical contents.
+
+        Returns:
+            int: The current catalog version
+        """
+        with self._cache_lock:
+            return self._catalog_version
+
+    def _bump_catalog_version(self):
+        """Invalidate the catalog cache after a write."""
+        with self._cache_lock:
+            self._catalog_version += 1
 
     def delete_barcode(self, barcode: str) -> bool:
         """
@@ -178,13 +461,18 @@ class DatabaseManager:
         Raises:
             Exception: For database-related errors during deletion
         """
-        session = self.get_session()
-        try:
-            result = session.query(Barcode).filter(Barcode.barcode == barcode).delete()
-            session.commit()
-            return result > 0
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+        with self._session() as session:
+            # Set-based DELETE in one statement; synchronize_session=False
+            # skips the identity-map scan since nothing reads the deleted
+            # object afterwards
+            result = (
+                session.query(Barcode)
+                .filter(Barcode.barcode == barcode)
+                .delete(synchronize_session=False)
+            )
+
+        self._bump_catalog_version()
+        with self._cache_lock:
+            self._cache.pop(barcode, None)
+
+        return result > 0
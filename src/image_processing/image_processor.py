@@ -7,9 +7,17 @@ operations with configurable parameters.
 """
 
 import cv2
+import numpy as np
 
 from ..config import Config
 
+# Detect a CUDA-capable OpenCV build once at import time. Plain pip
+# wheels ship without the cuda module, so every access is guarded.
+try:
+    CUDA_AVAILABLE = cv2.cuda.getCudaEnabledDeviceCount() > 0
+except (AttributeError, cv2.error):
+    CUDA_AVAILABLE = False
+
 
 class ImageProcessor:
     """
@@ -18,8 +26,40 @@ class ImageProcessor:
     This class provides methods to prepare camera frames for optimal
     text recognition by applying various computer vision techniques
     such as grayscale conversion, normalization, and thresholding.
+
+    Attributes:
+        ocr_scale (float): Scale factor applied to the most recent
+            preprocessed frame (per Config.OCR_MAX_WIDTH), used to map
+            OCR boxes back to the original frame coordinates
     """
 
+    ocr_scale = 1.0
+
+    # Reusable intermediate buffers, allocated lazily to match the camera
+    # resolution. Passing them as dst= to the cv2 calls keeps the
+    # per-frame path allocation-free and the pages warm in cache.
+    _gray_buf = None
+    _normalized_buf = None
+    _thresholded_buf = None
+
+    @staticmethod
+    def _buffer(name, shape):
+        """
+        Return the named reusable buffer, (re)allocating it on size change.
+
+        Args:
+            name (str): Class attribute name holding the buffer
+            shape (tuple): Required (height, width) of the buffer
+
+        Returns:
+            numpy.ndarray: uint8 buffer of the requested shape
+        """
+        buf = getattr(ImageProcessor, name)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, np.uint8)
+            setattr(ImageProcessor, name, buf)
+        return buf
+
     @staticmethod
     def preprocess(frame):
         """
@@ -34,23 +74,113 @@ class ImageProcessor:
 
         Returns:
             tuple: (processed_frame, normalized_frame) where processed_frame
-                  is ready for OCR and normalized_frame is for visualization
+                  is ready for OCR and normalized_frame is for visualization.
+                  Outside debug mode the normalization pass is skipped and
+                  the grayscale frame is returned in its place, since the
+                  normalized view only feeds a debug window.
+                  normalized_frame is a reused buffer that is only valid
+                  until the next preprocess call; consumers must not retain
+                  it across frames. processed_frame is freshly allocated by
+                  the OCR downscale and safe to hand to other threads.
         """
-        # Convert to grayscale
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        # Downscale up front so every later pass (grayscale, threshold,
+        # OCR) works on the reduced pixel count
+        frame = ImageProcessor._downscale_for_ocr(frame)
+
+        # Run the whole chain on the GPU when a CUDA build is available
+        if CUDA_AVAILABLE:
+            return ImageProcessor.preprocess_cuda(frame)
+
+        shape = frame.shape[:2]
+
+        # Convert to grayscale into the reusable buffer
+        gray = ImageProcessor._buffer("_gray_buf", shape)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray)
+
+        # Otsu picks the binarization threshold from the frame's own
+        # histogram, so it adapts to dim or low-contrast captures the
+        # way the old normalize-then-fixed-threshold chain did. That
+        # leaves the min/max normalization feeding only the "Normalized"
+        # debug window, so outside debug mode its full-frame scan and
+        # write are skipped entirely.
+        thresholded = ImageProcessor._threshold(
+            gray,
+            dst=ImageProcessor._buffer("_thresholded_buf", shape),
+            otsu=True,
+        )
 
-        # Normalize image to 0-255 range
-        normalized = cv2.normalize(gray, None, 0, 255, cv2.NORM_MINMAX)
+        if Config.DEBUG:
+            normalized = ImageProcessor._buffer("_normalized_buf", shape)
+            cv2.normalize(gray, normalized, 0, 255, cv2.NORM_MINMAX)
+        else:
+            normalized = gray
 
-        # Apply thresholding
-        thresholded = ImageProcessor._threshold(
-            normalized, threshold=Config.THRESHOLDING
+        # Hand out a fresh array so the shared buffer never escapes to
+        # the OCR worker thread
+        return thresholded.copy(), normalized
+
+    @staticmethod
+    def preprocess_cuda(frame):
+        """
+        GPU variant of preprocess using the cv2.cuda module.
+
+        Uploads the frame once, runs grayscale conversion, normalization,
+        and thresholding as device-side operations, and downloads the two
+        results. A single host-to-device transfer plus fused GPU passes
+        replaces three full CPU sweeps over the frame buffer.
+
+        Only called when a CUDA-enabled OpenCV build and device are
+        detected at import time.
+
+        Args:
+            frame (numpy.ndarray): Input BGR color image frame
+
+        Returns:
+            tuple: (processed_frame, normalized_frame) matching preprocess
+        """
+        gpu_frame = cv2.cuda_GpuMat()
+        gpu_frame.upload(frame)
+
+        gpu_gray = cv2.cuda.cvtColor(gpu_frame, cv2.COLOR_BGR2GRAY)
+
+        # cv2.cuda.threshold has no Otsu mode, so the GPU path keeps the
+        # baseline chain: contrast-stretch first, then the configured
+        # fixed threshold - both stay device-side passes
+        gpu_normalized = cv2.cuda.normalize(
+            gpu_gray, 0, 255, cv2.NORM_MINMAX, cv2.CV_8U
         )
+        _, gpu_thresholded = cv2.cuda.threshold(
+            gpu_normalized, Config.THRESHOLDING, 255, cv2.THRESH_BINARY
+        )
+
+        return gpu_thresholded.download(), gpu_normalized.download()
 
-        return thresholded, normalized
+    @staticmethod
+    def _downscale_for_ocr(frame):
+        """
+        Downscale a frame so its width fits Config.OCR_MAX_WIDTH.
+
+        Frames already within the limit are returned unchanged. The
+        applied scale is recorded in ImageProcessor.ocr_scale so OCR
+        boxes can be mapped back to full-resolution coordinates.
+        INTER_AREA keeps thin text strokes intact when shrinking.
+
+        Args:
+            frame (numpy.ndarray): Input BGR color image frame
+
+        Returns:
+            numpy.ndarray: The (possibly downscaled) frame
+        """
+        scale = min(1.0, Config.OCR_MAX_WIDTH / frame.shape[1])
+        ImageProcessor.ocr_scale = scale
+        if scale == 1.0:
+            return frame
+        return cv2.resize(
+            frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA
+        )
 
     @staticmethod
-    def _threshold(frame, threshold=127):
+    def _threshold(frame, threshold=127, dst=None, otsu=False):
         """
         Apply binary thresholding to enhance text contrast.
 
@@ -61,9 +191,15 @@ class ImageProcessor:
         Args:
             frame (numpy.ndarray): Grayscale input image
             threshold (int): Threshold value (0-255), defaults to 127
+            dst (numpy.ndarray, optional): Output buffer to write into,
+                avoiding a fresh allocation
+            otsu (bool): Derive the threshold from the image histogram
+                (Otsu's method) instead of the fixed value, making the
+                result robust to overall brightness and contrast
 
         Returns:
             numpy.ndarray: Binary thresholded image
         """
-        _, thresholded = cv2.threshold(frame, threshold, 255, cv2.THRESH_BINARY)
+        flags = cv2.THRESH_BINARY | (cv2.THRESH_OTSU if otsu else 0)
+        _, thresholded = cv2.threshold(frame, threshold, 255, flags, dst)
         return thresholded
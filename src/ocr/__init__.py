@@ -1,3 +1,4 @@
+from .ocr_worker import OCRWorker
 from .text_detector import TextDetector
 
-__all__ = ["TextDetector"]
+__all__ = ["OCRWorker", "TextDetector"]
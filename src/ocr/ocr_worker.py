@@ -0,0 +1,121 @@
+"""
+Background OCR worker for the Vision-Impaired Shopping Assistant.
+
+This module runs text detection on a dedicated thread so slow Tesseract
+passes never stall the camera capture and display loop. Frames are handed
+over through a single-slot queue with keep-latest semantics: the worker
+always processes the most recent capture and stale frames are dropped.
+"""
+
+import threading
+from queue import Empty, Queue
+
+
+def _put_latest(q, item):
+    """
+    Put an item into a single-slot queue, displacing any stale entry.
+
+    Args:
+        q (Queue): Single-slot queue to publish into
+        item: The item to publish
+    """
+    try:
+        q.get_nowait()
+    except Empty:
+        pass
+    q.put(item)
+
+
+class OCRWorker:
+    """
+    Runs a TextDetector on a background thread with keep-latest queues.
+
+    The main loop submits preprocessed frames without blocking and polls
+    for the most recent result; OCR latency therefore only affects how
+    fresh the drawn boxes are, never the capture/display frame rate.
+    Mirrors the async pattern the barcode handler uses for stdin input.
+
+    Attributes:
+        detector (TextDetector): Detector used for OCR processing
+    """
+
+    def __init__(self, detector):
+        """
+        Initialize the worker around an existing text detector.
+
+        Args:
+            detector (TextDetector): Detector that performs the OCR
+        """
+        self.detector = detector
+        self._frame_queue = Queue(maxsize=1)
+        self._result_queue = Queue(maxsize=1)
+        self._running = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """
+        Start the worker thread. Returns immediately if already running.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._running.set()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Signal the worker to stop and wait briefly for it to exit.
+        """
+        self._running.clear()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+
+    def submit(self, frame, scale=1.0):
+        """
+        Hand the freshest frame to the worker, dropping any pending one.
+
+        Never blocks: if the worker is still busy with a previous frame,
+        the queued (unprocessed) frame is replaced by this one.
+
+        Args:
+            frame (numpy.ndarray): Preprocessed frame ready for OCR
+            scale (float): Downscale factor applied before OCR, used to
+                          map boxes back to full-resolution coordinates
+        """
+        _put_latest(self._frame_queue, (frame, scale))
+
+    def get_result(self):
+        """
+        Return the newest OCR result, if one arrived since the last call.
+
+        Returns:
+            tuple: (boxes, text) from the most recent completed OCR pass,
+                  or None if no new result is available
+        """
+        try:
+            return self._result_queue.get_nowait()
+        except Empty:
+            return None
+
+    def _loop(self):
+        """
+        Consume submitted frames and publish OCR results until stopped.
+
+        Processing errors are reported and skipped rather than allowed
+        to kill the thread - a dead worker would leave the main loop
+        silently redrawing its last-known boxes forever. Mirrors the
+        per-item error handling in BarcodeInputHandler._input_loop.
+        """
+        while self._running.is_set():
+            try:
+                frame, scale = self._frame_queue.get(timeout=0.5)
+            except Empty:
+                continue
+
+            try:
+                boxes, text = self.detector.process_frame(frame, scale=scale)
+            except Exception as e:
+                print(f"Error in OCR processing: {e}")
+                continue
+            _put_latest(self._result_queue, (boxes, text))
@@ -9,17 +9,51 @@ with decorators for debugging.
 import time
 from functools import wraps
 
+import cv2
+import numpy as np
 import pytesseract
 
 from ..config import Config
 
+# tesserocr binds libtesseract in-process, avoiding the subprocess spawn
+# and temp-file round-trip pytesseract pays on every call. It needs a
+# compiled extension, so it stays optional with pytesseract as fallback.
+try:
+    from tesserocr import PSM, RIL, PyTessBaseAPI, iterate_level
+
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# Sparse-text page mode (matching the tesserocr path) with the LSTM-only
+# engine. The pytesseract default is full automatic page segmentation,
+# which runs layout analysis the label-reading use case never needs.
+TESSERACT_CONFIG = "--psm 11 --oem 1"
+
+
+# Snapshot of Config.DEBUG for the timeit wrappers. A single module
+# global load per call instead of the Config attribute chain; kept in
+# sync by a settings-change callback since DEBUG can be toggled at
+# runtime through the web API.
+_timing_enabled = Config.DEBUG
+
+
+def _sync_timing_flag():
+    global _timing_enabled
+    _timing_enabled = Config.DEBUG
+
+
+Config.register_callback(_sync_timing_flag)
+
 
 def timeit(message=None):
     """
     Decorator to measure and print execution time of functions.
 
     Only prints timing information when DEBUG mode is enabled in Config.
-    Useful for performance monitoring during development.
+    Useful for performance monitoring during development. The disabled
+    path costs one global-flag check; timings use time.perf_counter for
+    resolution that time.time cannot guarantee.
 
     Args:
         message (str, optional): Custom message to display with timing
@@ -31,12 +65,12 @@ def timeit(message=None):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if not Config.DEBUG:
+            if not _timing_enabled:
                 return func(*args, **kwargs)
 
-            start = time.time()
+            start = time.perf_counter()
             result = func(*args, **kwargs)
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             print(
                 f"{message}: {duration:.4f}s"
                 if message
@@ -74,6 +108,29 @@ class TextDetector:
         self.config = config or {}
         self.tts_manager = tts_manager
         self.last_text = ""
+        # Recently announced messages as (monotonic_time, text) pairs,
+        # used to suppress duplicates caused by OCR jitter
+        self._recent_announcements = []
+        # Perceptual hash of the last OCR'd frame plus its result, so
+        # visually unchanged frames skip Tesseract entirely
+        self._last_hash = None
+        self._last_boxes = {}
+        self._last_result_text = ""
+        # Text items of the last OCR pass; when a new pass yields the
+        # same tuple, the join and TTS bookkeeping are skipped entirely
+        self._last_text_tuple = None
+        # One persistent in-process Tesseract instance, reused across
+        # frames, when the tesserocr extension is installed. Construction
+        # raises RuntimeError (not ImportError) when tessdata or the
+        # language file can't be resolved - a machine where the tesseract
+        # binary works fine can still fail here, so fall back to
+        # pytesseract instead of letting it kill startup.
+        self._api = None
+        if TESSEROCR_AVAILABLE:
+            try:
+                self._api = PyTessBaseAPI(lang="eng", psm=PSM.SPARSE_TEXT)
+            except RuntimeError as e:
+                print(f"tesserocr unavailable ({e}), falling back to pytesseract")
 
     @timeit("OCR Time")
     def get_boxes(self, frame):
@@ -81,7 +138,10 @@ class TextDetector:
         Extract text bounding boxes from an image frame using OCR.
 
         Performs Tesseract OCR on the input frame and filters results
-        by confidence level and removes empty text entries.
+        by confidence level and removes empty text entries. Uses the
+        persistent tesserocr instance when available; otherwise falls
+        back to pytesseract, which spawns a tesseract subprocess per
+        call.
 
         Args:
             frame: Input image frame for text detection
@@ -89,11 +149,72 @@ class TextDetector:
         Returns:
             dict: Filtered OCR data with text boxes and confidence scores
         """
-        data = pytesseract.image_to_data(frame, output_type=pytesseract.Output.DICT)
-        data = self._filter_confidence(data)
-        return self._filter_blank(data)
+        if self._api is not None:
+            data = self._image_to_data_tesserocr(frame)
+        else:
+            # A contiguous single-channel array avoids an internal copy
+            # before pytesseract hands the image off
+            data = pytesseract.image_to_data(
+                np.ascontiguousarray(frame),
+                output_type=pytesseract.Output.DICT,
+                config=TESSERACT_CONFIG,
+            )
+        return self._filter_boxes(data)
+
+    def _image_to_data_tesserocr(self, frame):
+        """
+        Run OCR through the persistent in-process tesserocr instance.
+
+        Hands the frame buffer to libtesseract directly - no subprocess
+        spawn, no temp-file write - and collects word-level results into
+        the same dict shape pytesseract.image_to_data produces, so the
+        downstream filtering and overlay code is oblivious to which
+        backend ran.
 
-    def process_frame(self, frame):
+        Args:
+            frame (numpy.ndarray): Grayscale input image
+
+        Returns:
+            dict: OCR data with 'text', 'conf', 'left', 'top', 'width',
+                 and 'height' lists
+        """
+        frame = np.ascontiguousarray(frame)
+        height, width = frame.shape[:2]
+        self._api.SetImageBytes(frame.tobytes(), width, height, 1, width)
+        # GetIterator does not trigger recognition itself (only the
+        # Get*Text helpers do) and returns None until it has run
+        self._api.Recognize()
+
+        data = {
+            "text": [],
+            "conf": [],
+            "left": [],
+            "top": [],
+            "width": [],
+            "height": [],
+        }
+        iterator = self._api.GetIterator()
+        if iterator is None:
+            return data
+
+        for word in iterate_level(iterator, RIL.WORD):
+            try:
+                text = word.GetUTF8Text(RIL.WORD)
+            except RuntimeError:
+                continue
+            box = word.BoundingBox(RIL.WORD)
+            if box is None:
+                continue
+            left, top, right, bottom = box
+            data["text"].append(text)
+            data["conf"].append(word.Confidence(RIL.WORD))
+            data["left"].append(left)
+            data["top"].append(top)
+            data["width"].append(right - left)
+            data["height"].append(bottom - top)
+        return data
+
+    def process_frame(self, frame, scale=1.0):
         """
         Process a frame for text detection and trigger TTS if text changes.
 
@@ -103,67 +224,147 @@ class TextDetector:
 
         Args:
             frame: Input image frame for processing
+            scale (float): Downscale factor that was applied to the frame
+                           before OCR; boxes are mapped back to original
+                           frame coordinates by 1/scale
 
         Returns:
-            tuple: (boxes, text) where boxes contains OCR data and text is the extracted string
+            tuple: (boxes, text) where boxes contains OCR data (in original
+                  frame coordinates) and text is the extracted string
         """
-        boxes = self.get_boxes(frame)
-        text = " ".join(boxes.get("text", []))
+        # Skip OCR when the scene is visually unchanged (user holding
+        # the camera still over a label) and reuse the previous result -
+        # a 64-bit hash comparison instead of a full Tesseract pass
+        current_hash = self._frame_hash(frame)
+        if current_hash == self._last_hash:
+            return self._last_boxes, self._last_result_text
 
+        boxes = self.get_boxes(frame)
+        if scale != 1.0:
+            boxes = self._rescale_boxes(boxes, scale)
+
+        # When the new pass found the exact same words, reuse the joined
+        # string and skip the TTS bookkeeping - nothing downstream changes
+        text_items = tuple(boxes.get("text", ()))
+        if text_items == self._last_text_tuple:
+            self._last_hash = current_hash
+            self._last_boxes = boxes
+            return boxes, self._last_result_text
+
+        text = " ".join(text_items)
         if text and text != self.last_text and self.tts_manager:
-            tts_message = Config.TTS_OCR_TEMPLATE.format(text=text)
-            self.tts_manager.say_async(tts_message)
+            tts_message = Config._ocr_fmt(text=text)
+            if self._should_announce(tts_message):
+                self.tts_manager.say_async(tts_message)
             self.last_text = text
         elif not text:
             self.last_text = ""
 
+        self._last_hash = current_hash
+        self._last_boxes = boxes
+        self._last_result_text = text
+        self._last_text_tuple = text_items
         return boxes, text
 
-    def get_average_confidence(self, data):
+    def _frame_hash(self, frame):
         """
-        Calculate the average confidence score from OCR data.
+        Compute a tiny perceptual hash of a frame.
+
+        Downscales the frame to 8x8 and thresholds it against its own
+        mean, producing a 64-bit fingerprint. Costs microseconds versus
+        hundreds of milliseconds for a Tesseract pass, so it makes a
+        cheap gate for detecting visually identical consecutive frames.
 
         Args:
-            data (dict): OCR data dictionary containing confidence scores
+            frame (numpy.ndarray): Input image frame
 
         Returns:
-            float: Average confidence score, or 0 if no confidence data available
+            bytes: Fingerprint of the frame's coarse structure
         """
-        return sum(data["conf"]) / len(data["conf"]) if data["conf"] else 0
+        small = cv2.resize(frame, (8, 8), interpolation=cv2.INTER_AREA)
+        return (small > small.mean()).tobytes()
 
-    def _filter_confidence(self, data, min_conf=60):
+    def _should_announce(self, text, window=2.0):
         """
-        Filter OCR results by confidence threshold.
+        Decide whether a message should be spoken or is a recent duplicate.
 
-        Removes low-confidence text detections to improve accuracy
-        and reduce false positives in text recognition.
+        OCR jitter can flip detected text back and forth between frames,
+        which would re-trigger identical announcements through the
+        last_text check. Messages spoken within the last `window` seconds
+        are suppressed.
 
         Args:
-            data (dict): Raw OCR data from Tesseract
-            min_conf (int): Minimum confidence threshold (0-100)
+            text (str): The candidate announcement
+            window (float): Deduplication window in seconds
 
         Returns:
-            dict: Filtered OCR data containing only high-confidence results
+            bool: True if the message should be spoken
         """
+        now = time.monotonic()
+        self._recent_announcements = [
+            (t, s) for t, s in self._recent_announcements if now - t < window
+        ]
+        if any(s == text for _, s in self._recent_announcements):
+            return False
+        self._recent_announcements.append((now, text))
+        return True
+
+    def _rescale_boxes(self, data, scale):
+        """
+        Map OCR box coordinates from the downscaled frame back to full size.
+
+        Args:
+            data (dict): OCR data with 'left', 'top', 'width', 'height' lists
+            scale (float): Downscale factor that was applied before OCR
+
+        Returns:
+            dict: OCR data with box coordinates in original frame coordinates
+        """
+        inverse = 1.0 / scale
         return {
-            k: [v[i] for i, conf in enumerate(data["conf"]) if float(conf) > min_conf]
-            for k, v in data.items()
+            k: (
+                [int(v * inverse) for v in values]
+                if k in ("left", "top", "width", "height")
+                else values
+            )
+            for k, values in data.items()
         }
 
-    def _filter_blank(self, data):
+    def get_average_confidence(self, data):
         """
-        Remove empty or whitespace-only text entries from OCR data.
+        Calculate the average confidence score from OCR data.
 
-        Cleans up OCR results by removing entries that contain only
-        whitespace or are completely empty.
+        Args:
+            data (dict): OCR data dictionary containing confidence scores
+
+        Returns:
+            float: Average confidence score, or 0 if no confidence data available
+        """
+        return sum(data["conf"]) / len(data["conf"]) if data["conf"] else 0
+
+    def _filter_boxes(self, data, min_conf=60):
+        """
+        Drop low-confidence and blank entries from OCR data in one pass.
+
+        Builds a single NumPy boolean mask combining the confidence
+        threshold and the non-blank-text check, then rebuilds the dict
+        once from the surviving indices. The mask construction runs as
+        C loops instead of per-key Python list comprehensions with a
+        float() parse per element.
 
         Args:
-            data (dict): OCR data dictionary
+            data (dict): Raw OCR data from Tesseract
+            min_conf (int): Minimum confidence threshold (0-100)
 
         Returns:
-            dict: Cleaned OCR data with empty text entries removed
+            dict: Filtered OCR data containing only confident, non-blank
+                 results
         """
-        return {
-            k: [v[i] for i, text in enumerate(data["text"]) if text.strip()]
-            for k, v in data.items()
-        }
+        if not data["text"]:
+            return data
+
+        conf = np.asarray(data["conf"], dtype=np.float32)
+        texts = np.asarray(data["text"], dtype=str)
+        mask = (conf > min_conf) & (np.char.str_len(np.char.strip(texts)) > 0)
+        keep = np.flatnonzero(mask)
+        return {k: [v[i] for i in keep] for k, v in data.items()}
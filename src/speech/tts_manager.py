@@ -6,7 +6,8 @@ with configurable speech rate and non-blocking audio output to ensure
 the main application remains responsive during speech synthesis.
 """
 
-from threading import Thread
+import threading
+from queue import Full, Queue
 
 import pyttsx3
 
@@ -17,60 +18,84 @@ class TTSManager:
     """
     Manages text-to-speech operations in a thread-safe manner.
 
-    This class provides asynchronous speech synthesis to avoid blocking
-    the main application thread. It integrates with the Config system
-    for dynamic speech rate adjustments.
+    A single long-lived pyttsx3 engine is driven by one dedicated worker
+    thread consuming a bounded queue. say_async enqueues instead of
+    dropping, so announcements issued while a prior utterance plays are
+    spoken afterwards rather than lost. The speech rate is only pushed
+    to the engine when Config.TTS_SPEED actually changes, avoiding a
+    driver property-set per utterance.
 
     Attributes:
         engine: pyttsx3 TTS engine instance
-        _tts_thread: Background thread for speech synthesis
+        QUEUE_MAX (int): Maximum queued utterances before new ones are
+            discarded (keeps a backlog from echoing stale announcements)
     """
 
+    QUEUE_MAX = 4
+
     def __init__(self):
         """
-        Initialize the TTS manager with a pyttsx3 engine.
+        Initialize the TTS manager with a pyttsx3 engine and worker thread.
 
-        The engine is configured with settings from the Config class
-        and prepared for thread-safe operation.
+        The engine is created once and reused for every utterance; the
+        worker thread starts immediately and waits on the queue.
         """
         self.engine = pyttsx3.init()
-        self._tts_thread = None
+        self._queue = Queue(maxsize=self.QUEUE_MAX)
+        self._applied_rate = None
+        self._worker = threading.Thread(target=self._speak_loop, daemon=True)
+        self._worker.start()
 
     def say_async(self, text):
         """
-        Speak text asynchronously without blocking the main thread.
+        Queue text for speech without blocking the calling thread.
 
-        If the TTS engine is already speaking, the new text is ignored
-        to prevent overlapping speech.
+        If the backlog is already full (QUEUE_MAX pending utterances),
+        the text is discarded - by the time the engine got to it, the
+        announcement would describe something no longer in view.
 
         Args:
             text (str): The text to speak
         """
-        if self._tts_thread and self._tts_thread.is_alive():
-            return  # Skip if still speaking
-
-        self._tts_thread = Thread(target=self._speak, args=(text,), daemon=True)
-        self._tts_thread.start()
+        try:
+            self._queue.put_nowait(text)
+        except Full:
+            pass  # Backlog full - stale announcements aren't worth queueing
 
-    def _speak(self, text):
+    def _speak_loop(self):
         """
-        Internal method to handle the actual speech synthesis.
-
-        This method runs in a separate thread and updates engine
-        settings before speaking to ensure current configuration is used.
-
-        Args:
-            text (str): The text to synthesize
+        Worker loop that feeds queued utterances to the shared engine.
+
+        Runs for the life of the process on a daemon thread, so no
+        explicit shutdown is needed. A driver error (runAndWait is known
+        to raise RuntimeError on some backends) costs only that one
+        utterance: the engine is re-created and the loop continues,
+        since a dead loop would silently end all speech for users who
+        depend on it.
         """
-        self._update_configs()
-        self.engine.say(text)
-        self.engine.runAndWait()
+        while True:
+            text = self._queue.get()
+            try:
+                self._update_configs()
+                self.engine.say(text)
+                self.engine.runAndWait()
+            except Exception as e:
+                print(f"TTS error, reinitializing engine: {e}")
+                try:
+                    self.engine = pyttsx3.init()
+                    self._applied_rate = None
+                except Exception as init_error:
+                    print(f"TTS engine reinit failed: {init_error}")
 
     def _update_configs(self):
         """
-        Update TTS engine settings from the current configuration.
+        Push TTS engine settings that changed since the last utterance.
 
-        This ensures that any runtime configuration changes are
-        applied before speech synthesis begins.
+        setProperty goes through the platform speech driver, so it is
+        only called when Config.TTS_SPEED differs from the rate already
+        applied to the engine.
         """
-        self.engine.setProperty("rate", Config.TTS_SPEED)
+        rate = Config.TTS_SPEED
+        if rate != self._applied_rate:
+            self.engine.setProperty("rate", rate)
+            self._applied_rate = rate
@@ -1,4 +1,4 @@
 from .display import DisplayManager
-from .text_overlay import TextOverlay
+from .text_overlay import TextOverlay, TextOverlayGPU
 
-__all__ = ["DisplayManager", "TextOverlay"]
+__all__ = ["DisplayManager", "TextOverlay", "TextOverlayGPU"]
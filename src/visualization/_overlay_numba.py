@@ -0,0 +1,63 @@
+"""
+Optional Numba-compiled rectangle rasterizer for the text overlay.
+
+When hundreds of boxes survive filtering, even the batched polylines
+path pays O(N) Python work building contour arrays. This kernel writes
+the four edges of every rectangle straight into the frame buffer as a
+JIT-compiled parallel loop. Numba needs a compiled toolchain, so it
+stays optional; TextOverlay falls back to polylines without it.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def draw_rects(frame, left, top, width, height, blue, green, red, thickness):
+        """
+        Rasterize rectangle outlines directly into a BGR frame buffer.
+
+        Edges are clipped against the frame borders; boxes are processed
+        in parallel. The first call pays JIT compilation (cached on
+        disk); steady state is pure native code.
+
+        Args:
+            frame (numpy.ndarray): HxWx3 uint8 frame, written in place
+            left, top, width, height (numpy.ndarray): int32 box columns
+            blue, green, red (int): BGR edge color components
+            thickness (int): Edge thickness in pixels
+        """
+        rows, cols = frame.shape[0], frame.shape[1]
+        for i in prange(left.shape[0]):
+            x1 = max(0, left[i])
+            y1 = max(0, top[i])
+            x2 = min(cols, left[i] + width[i])
+            y2 = min(rows, top[i] + height[i])
+            if x2 <= x1 or y2 <= y1:
+                continue
+
+            for y in range(y1, min(y1 + thickness, y2)):  # Top edge
+                for x in range(x1, x2):
+                    frame[y, x, 0] = blue
+                    frame[y, x, 1] = green
+                    frame[y, x, 2] = red
+            for y in range(max(y1, y2 - thickness), y2):  # Bottom edge
+                for x in range(x1, x2):
+                    frame[y, x, 0] = blue
+                    frame[y, x, 1] = green
+                    frame[y, x, 2] = red
+            for y in range(y1, y2):  # Left and right edges
+                for x in range(x1, min(x1 + thickness, x2)):
+                    frame[y, x, 0] = blue
+                    frame[y, x, 1] = green
+                    frame[y, x, 2] = red
+                for x in range(max(x1, x2 - thickness), x2):
+                    frame[y, x, 0] = blue
+                    frame[y, x, 1] = green
+                    frame[y, x, 2] = red
@@ -17,6 +17,11 @@ class DisplayManager:
     used for displaying processed frames, debug information, and visual feedback
     during development and debugging.
 
+    Windows are registered with cv2.namedWindow once on first use, with
+    an OpenGL-backed surface when the OpenCV build supports it (GPU blit
+    instead of a CPU copy per refresh); later show calls just push the
+    frame.
+
     Attributes:
         windows (set): Set of active window names for tracking
     """
@@ -31,22 +36,30 @@ class DisplayManager:
         """
         Display a frame in a named OpenCV window.
 
-        Creates or updates a window with the given name to show the frame.
-        Tracks window names for proper cleanup.
+        Registers the window on first use, preferring an OpenGL surface
+        and falling back to a plain window on builds without OpenGL
+        support. Tracks window names for proper cleanup.
 
         Args:
             name (str): Name of the window
             frame (numpy.ndarray): Image frame to display
         """
-        self.windows.add(name)
+        if name not in self.windows:
+            try:
+                cv2.namedWindow(name, cv2.WINDOW_AUTOSIZE | cv2.WINDOW_OPENGL)
+            except cv2.error:
+                cv2.namedWindow(name, cv2.WINDOW_AUTOSIZE)
+            self.windows.add(name)
         cv2.imshow(name, frame)
 
     def cleanup(self):
         """
-        Close all OpenCV windows and clear tracking.
+        Close the windows this manager opened and clear tracking.
 
-        This method should be called when shutting down the application
+        Destroys only the tracked windows rather than every HighGUI
+        window in the process. Called when shutting down the application
         or when switching out of debug mode to properly release resources.
         """
-        cv2.destroyAllWindows()
+        for name in self.windows:
+            cv2.destroyWindow(name)
         self.windows.clear()
@@ -7,6 +7,11 @@ and barcode database operations. The API allows external clients to:
 - CRUD operations for barcode entries
 - Integration with the main application
 
+The app is built through a factory so importing this module has no side
+effects: the database connection and schema creation only happen when
+create_app runs, which keeps imports cheap and fork-safe under
+multi-process WSGI servers.
+
 Endpoints:
     GET /api/settings - Retrieve current settings
     POST /api/settings - Update settings
@@ -16,32 +21,96 @@ Endpoints:
     DELETE /api/barcodes/<id> - Delete barcode
 """
 
+import functools
+import hashlib
+import secrets
 from threading import Thread
 
-from flask import Flask, jsonify, request
+import orjson
+from flask import Blueprint, Flask, Response, current_app, jsonify, request
+from flask_compress import Compress
 from flask_cors import CORS
+from waitress import serve
 
+from src.barcode.input_handler import clear_barcode_cache
 from src.config import Config
 from src.db.models import BarcodeExistsError, DatabaseManager
 
-app = Flask(__name__)
-CORS(app)
-db_manager = DatabaseManager()
-db_manager.init_db()
+api = Blueprint("api", __name__)
+
+# Per-process nonce salted into catalog ETags. The catalog version is an
+# in-memory counter that restarts at zero, so without the salt a client
+# holding an ETag from a previous run could get a false 304 from a new
+# process whose same-numbered version has different contents.
+_BOOT_NONCE = secrets.token_hex(4)
+
+# Precomputed /api/settings response body and its ETag. Settings only
+# change through update paths that fire the Config change callbacks, so
+# the blob is rebuilt there and GETs return pointer-stable bytes.
+_settings_blob = b""
+_settings_etag = ""
+
+
+def _refresh_settings_blob():
+    """Re-serialize the settings payload and derive a fresh ETag."""
+    global _settings_blob, _settings_etag
+    _settings_blob = orjson.dumps(Config.get_all_settings())
+    _settings_etag = f'"{hashlib.md5(_settings_blob).hexdigest()}"'
+
+
+_refresh_settings_blob()
+Config.register_callback(_refresh_settings_blob)
 
 
-@app.route("/api/settings", methods=["GET"])
+@functools.lru_cache(maxsize=4096)
+def _barcode_payload(barcode):
+    """
+    Return the serialized response body for a single barcode lookup.
+
+    Caches the orjson-encoded bytes, so repeat GETs for the same code
+    skip both the database lookup and re-serialization. Cleared by the
+    mutating endpoints whenever the table changes.
+
+    Args:
+        barcode (str): The barcode identifier to look up
+
+    Returns:
+        bytes: Encoded JSON body, or None if the barcode is unknown
+    """
+    result = current_app.db_manager.get_barcode(barcode)
+    if not result:
+        return None
+    return orjson.dumps(
+        {
+            "barcode": result.barcode,
+            "product_name": result.product_name,
+            "brand": result.brand,
+            "allergies": result.allergies,
+        }
+    )
+
+
+@api.route("/api/settings", methods=["GET"])
 def get_settings():
     """
     Get all current configuration settings.
 
+    Serves the precomputed payload and honors If-None-Match, so polling
+    clients usually get an empty 304 instead of a re-serialized body.
+
     Returns:
         JSON response containing all configuration settings
     """
-    return jsonify(Config.get_all_settings())
+    if request.if_none_match.contains(_settings_etag.strip('"')):
+        return Response(status=304, headers={"ETag": _settings_etag})
+    return Response(
+        _settings_blob,
+        mimetype="application/json",
+        headers={"ETag": _settings_etag},
+    )
 
 
-@app.route("/api/settings", methods=["POST"])
+@api.route("/api/settings", methods=["POST"])
 def update_settings():
     """
     Update configuration settings.
@@ -59,33 +128,55 @@ def update_settings():
         return jsonify({"error": "No settings provided"}), 400
 
     updated = Config.update_settings(settings)
-    print("Settings:", Config.get_all_settings())
+    # %-style args defer formatting until the DEBUG level is enabled
+    current_app.logger.debug("Settings updated: %s", updated)
     return jsonify({"updated": updated})
 
 
-@app.route("/api/barcodes", methods=["GET"])
+@api.route("/api/barcodes", methods=["GET"])
 def get_barcodes():
     """
     Retrieve all barcode entries from the database.
 
+    The whole catalog is pulled column-wise from the database manager's
+    cache and encoded with orjson, whose C encoder is several times
+    faster than the stdlib json that jsonify goes through - noticeable
+    once the catalog reaches thousands of entries. The catalog version
+    counter doubles as a weak ETag, so clients polling an unchanged
+    catalog get an empty 304 instead of the full payload.
+
     Returns:
         JSON array containing all barcode entries with their details
     """
-    barcodes = db_manager.get_all_barcodes()
-    return jsonify(
+    etag = f"{_BOOT_NONCE}-{current_app.db_manager.catalog_version}"
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+
+    columns = current_app.db_manager.get_all_barcodes_columns()
+    payload = orjson.dumps(
         [
             {
-                "barcode": b.barcode,
-                "product_name": b.product_name,
-                "brand": b.brand,
-                "allergies": b.allergies,
+                "barcode": barcode,
+                "product_name": product_name,
+                "brand": brand,
+                "allergies": allergies,
             }
-            for b in barcodes
+            for barcode, product_name, brand, allergies in zip(
+                columns["barcode"],
+                columns["product_name"],
+                columns["brand"],
+                columns["allergies"],
+            )
         ]
     )
+    response = Response(payload, mimetype="application/json")
+    response.set_etag(etag, weak=True)
+    return response
 
 
-@app.route("/api/barcodes/<barcode>", methods=["GET"])
+@api.route("/api/barcodes/<barcode>", methods=["GET"])
 def get_barcode(barcode):
     """
     Retrieve a specific barcode entry by its ID.
@@ -99,20 +190,13 @@ def get_barcode(barcode):
     Raises:
         404: If barcode is not found in database
     """
-    result = db_manager.get_barcode(barcode)
-    if not result:
+    payload = _barcode_payload(barcode)
+    if payload is None:
         return jsonify({"error": "Barcode not found"}), 404
-    return jsonify(
-        {
-            "barcode": result.barcode,
-            "product_name": result.product_name,
-            "brand": result.brand,
-            "allergies": result.allergies,
-        }
-    )
+    return Response(payload, mimetype="application/json")
 
 
-@app.route("/api/barcodes", methods=["POST"])
+@api.route("/api/barcodes", methods=["POST"])
 def add_barcode():
     """
     Add a new barcode entry to the database.
@@ -133,12 +217,14 @@ def add_barcode():
         return jsonify({"error": "Missing required fields"}), 400
 
     try:
-        barcode_data = db_manager.add_barcode(
+        barcode_data = current_app.db_manager.add_barcode(
             data["barcode"],
             data["product_name"],
             data["brand"],
             data.get("allergies"),  # Optional field
         )
+        clear_barcode_cache()  # Scanner-side lookups must see the new entry
+        _barcode_payload.cache_clear()
         return jsonify(barcode_data), 201
     except BarcodeExistsError as e:
         return jsonify({"error": str(e)}), 409
@@ -146,7 +232,7 @@ def add_barcode():
         return jsonify({"error": str(e)}), 400
 
 
-@app.route("/api/barcodes/<barcode>", methods=["DELETE"])
+@api.route("/api/barcodes/<barcode>", methods=["DELETE"])
 def delete_barcode(barcode):
     """
     Delete a barcode entry from the database.
@@ -160,27 +246,71 @@ def delete_barcode(barcode):
     Raises:
         404: If barcode is not found
     """
-    if db_manager.delete_barcode(barcode):
+    if current_app.db_manager.delete_barcode(barcode):
+        clear_barcode_cache()  # Drop the deleted entry from scanner lookups
+        _barcode_payload.cache_clear()
         return jsonify({"message": "Barcode deleted"}), 200
     return jsonify({"error": "Barcode not found"}), 404
 
 
-def run_api(host="0.0.0.0", port=5001):
+def create_app(db_manager=None):
+    """
+    Build the Flask application and initialize its database manager.
+
+    Args:
+        db_manager (DatabaseManager, optional): Existing manager to
+            share with the rest of the application. If None, a new one
+            is created and its schema initialized.
+
+    Returns:
+        Flask: Configured application with the API blueprint registered
+    """
+    app = Flask(__name__)
+    CORS(app)
+    Compress(app)  # gzip/brotli for the larger JSON payloads
+
+    if db_manager is None:
+        db_manager = DatabaseManager()
+        db_manager.init_db()
+    app.db_manager = db_manager
+
+    app.register_blueprint(api)
+    return app
+
+
+def run_api(host="0.0.0.0", port=5001, db_manager=None):
     """
-    Start the Flask API server.
+    Start the API behind the waitress WSGI server.
+
+    waitress replaces Flask's single-process development server with a
+    real worker pool and HTTP parser, which the dev server's docs
+    themselves warn is not meant for production throughput.
 
     Args:
         host (str): Host address to bind to, defaults to all interfaces
         port (int): Port number to listen on, defaults to 5001
+        db_manager (DatabaseManager, optional): Manager shared with the
+            rest of the application
     """
-    app.run(host=host, port=port, debug=False, threaded=True)
+    serve(
+        create_app(db_manager),
+        host=host,
+        port=port,
+        threads=8,
+        channel_timeout=30,
+    )
 
 
-def start_server():
+def start_server(db_manager=None):
     """
     Start the API server in a background daemon thread.
 
     This allows the API to run alongside the main application
     without blocking the main execution thread.
+
+    Args:
+        db_manager (DatabaseManager, optional): Manager shared with the
+            rest of the application, so the API and the barcode scanner
+            see one cache and one connection pool
     """
-    Thread(target=run_api, daemon=True).start()
+    Thread(target=run_api, kwargs={"db_manager": db_manager}, daemon=True).start()